@@ -9,6 +9,19 @@ MAX_ARTICLES = 5
 # Hours to look back for articles
 HOURS_LOOKBACK = 48
 
+# Maximum number of RSS feeds fetched in parallel
+MAX_FEED_WORKERS = 8
+
+# Bloom filter sizing for remembering already-processed article links
+SEEN_FILTER_CAPACITY = 100_000
+SEEN_FILTER_ERROR_RATE = 0.001
+
+# Max simhash Hamming distance (bits) for two articles to count as the same story
+SIMHASH_MAX_DISTANCE = 3
+
+# Days to keep cached Perplexity summaries (avoids paying twice on reruns)
+SUMMARY_CACHE_DAYS = 7
+
 # RSS Feed URLs for AI news sources
 RSS_FEEDS = [
     {
@@ -3,20 +3,98 @@ AI News Summarizer - Local MVP
 Fetches AI news from RSS feeds, summarizes using Perplexity API, and posts to Telegram
 """
 
+import calendar
+import hashlib
+import html
 import os
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from dotenv import load_dotenv
-import feedparser
-import requests
 
 import config
 
+# Third-party packages are imported inside the functions that use them, so
+# interpreter start-up only pays for what a run actually reaches
+
+# Shared session (created on first use) so repeated API calls reuse pooled keep-alive TLS connections
+_SESSION = None
+
+# Ask feed servers for compressed bodies; urllib3 decodes br when brotli is installed
+FEED_REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br",
+    "User-Agent": "spectrum/1.0"
+}
+
+# Root elements of RSS 2.0 (rss), RSS 1.0 (rdf:RDF) and Atom (feed) documents
+FEED_ROOT_TAGS = ("rss", "RDF", "feed")
+
+# Extension elements read from RSS items (Dublin Core dc:date, content:encoded)
+DC_DATE_TAG = "{http://purl.org/dc/elements/1.1/}date"
+CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# Telegram rejects messages over 4096 characters, keep some headroom
+TELEGRAM_MESSAGE_LIMIT = 4000
+TELEGRAM_ARTICLE_SEPARATOR = "\n\n---\n\n"
+
+# Telegram message templates (parse_mode=HTML, values are escaped before formatting)
+ARTICLE_TEMPLATE = "Source: {feed_name}\n\nHeadline: {title}\n\nSummary: {summary}\n\nLink: {url}"
+OVERVIEW_TEMPLATE = "📊 <b>Daily AI News Overview</b> ({date})\n\n{summary}"
+
+
+@dataclass(slots=True)
+class Article:
+    """A feed entry moving through the fetch -> filter -> summarize -> send pipeline"""
+    feed_name: str
+    title: str
+    link: str
+    published: str
+    published_ts: int
+    description: str
+    published_datetime: datetime | None = None
+    summary: str | None = None
+    error: str | None = None
+    processed_at: str | None = None
+
+
+def get_session():
+    """
+    Return the shared requests session with connection pooling and retries
+    """
+    global _SESSION
+    
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            # Every call through the session is a non-idempotent POST (a replayed
+            # sendMessage duplicates the message, a replayed summary is billed again),
+            # so only retry when the request was certainly not processed: connection
+            # failures and 429 / 503 responses. Read timeouts and 502 / 504 are not retried.
+            max_retries=Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=["POST"]
+            )
+        ))
+    
+    return _SESSION
+
 
 def load_env():
     """Load environment variables from .env file"""
+    from dotenv import load_dotenv
+    
     load_dotenv()
     
     perplexity_key = os.getenv("PERPLEXITY_API_KEY")
@@ -33,113 +111,476 @@ def load_env():
     return perplexity_key, telegram_token, telegram_chat_id
 
 
+def load_feed_cache():
+    """
+    Load per-feed conditional GET state (ETag, Last-Modified, last entries) from storage
+    Returns dict mapping feed URL -> {etag, modified, entries}
+    """
+    cache_file = Path("storage") / "feed_cache.json"
+    
+    if not cache_file.exists():
+        return {}
+    
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Could not read feed cache - {e}\n")
+        return {}
+    
+    return cache
+
+
+def save_feed_cache(cache):
+    """
+    Atomically write per-feed conditional GET state to storage
+    """
+    storage_dir = Path("storage")
+    storage_dir.mkdir(exist_ok=True)
+    
+    cache_file = storage_dir / "feed_cache.json"
+    tmp_file = cache_file.with_suffix(".json.tmp")
+    
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+
+
+def _parse_feed_date(text, iso8601):
+    """
+    Parse an ISO 8601 (Atom, Dublin Core) or RFC 822 (RSS pubDate) date string
+    RFC 822 dates that fail to parse are retried as ISO 8601, which some feeds put in pubDate
+    Returns a Unix timestamp, or None if the date is missing or invalid
+    """
+    if not text:
+        return None
+    
+    pub_time = None
+    if not iso8601:
+        try:
+            pub_time = parsedate_to_datetime(text)
+        except (ValueError, TypeError):
+            pass
+    
+    if pub_time is None:
+        try:
+            pub_time = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    
+    # Timezone-less dates are taken as UTC
+    if pub_time.tzinfo is not None:
+        pub_time = pub_time.astimezone(timezone.utc)
+    return calendar.timegm(pub_time.utctimetuple())
+
+
+def _localname(elem):
+    """
+    Return an element's tag without its namespace, or "" for comments / processing instructions
+    """
+    return elem.tag.rpartition("}")[2] if isinstance(elem.tag, str) else ""
+
+
+def _namespace(elem):
+    """
+    Return an element's namespace in Clark notation ("{uri}"), or "" if it has none
+    """
+    return elem.tag[:elem.tag.index("}") + 1] if elem.tag.startswith("{") else ""
+
+
+def _child_text(elem, *tags):
+    """
+    Return the stripped text of the first non-empty child whose full tag is in tags
+    Tags are matched with their namespace, so e.g. media:title never stands in for title
+    """
+    for tag in tags:
+        for child in elem:
+            if child.tag == tag:
+                text = "".join(child.itertext()).strip()
+                if text:
+                    return text
+    return ""
+
+
+def _atom_link(entry):
+    """
+    Return the href of an Atom entry's alternate link
+    """
+    link_tag = _namespace(entry) + "link"
+    for child in entry:
+        if child.tag == link_tag and child.get("rel", "alternate") == "alternate":
+            return child.get("href", "")
+    return ""
+
+
+def parse_feed_stream(fileobj):
+    """
+    Incrementally parse an RSS or Atom document from a file-like object
+    Each item/entry element is released as soon as it has been read, so memory
+    stays proportional to one entry instead of the whole feed
+    Raises ValueError if the document is not a feed (e.g. an HTML error page)
+    Yields dicts with: title, link, published_ts, published, description
+    """
+    from lxml import etree
+    
+    is_feed = False
+    events = etree.iterparse(
+        fileobj,
+        events=("start", "end"),
+        tag=("{*}rss", "{*}RDF", "{*}feed", "{*}item", "{*}entry"),
+        recover=True,
+        resolve_entities=False,
+        no_network=True
+    )
+    
+    for event, elem in events:
+        name = _localname(elem)
+        
+        if event == "start":
+            # The first matched element must be the feed root
+            if name in FEED_ROOT_TAGS:
+                is_feed = True
+            elif not is_feed:
+                break
+            continue
+        
+        if name not in ("item", "entry"):
+            continue
+        
+        # Core fields live in the entry's own namespace: Atom for entries,
+        # none for RSS 2.0 items and the RSS 1.0 namespace for rdf:RDF items
+        ns = _namespace(elem)
+        
+        if name == "entry":
+            # Atom
+            published = _child_text(elem, ns + "published", ns + "updated")
+            entry = {
+                "title": _child_text(elem, ns + "title") or "No title",
+                "link": _atom_link(elem),
+                "published_ts": _parse_feed_date(published, iso8601=True),
+                "published": published,
+                "description": _child_text(elem, ns + "summary", ns + "content")
+            }
+        else:
+            # RSS 2.0 uses an RFC 822 pubDate, RSS 1.0 an ISO 8601 dc:date
+            published = _child_text(elem, ns + "pubDate")
+            if published:
+                published_ts = _parse_feed_date(published, iso8601=False)
+            else:
+                published = _child_text(elem, DC_DATE_TAG)
+                published_ts = _parse_feed_date(published, iso8601=True)
+            
+            entry = {
+                "title": _child_text(elem, ns + "title") or "No title",
+                "link": _child_text(elem, ns + "link"),
+                "published_ts": published_ts,
+                "published": published,
+                "description": _child_text(elem, ns + "description", CONTENT_ENCODED_TAG)
+            }
+        
+        # Free the parsed entry and any already-processed siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        
+        yield entry
+    
+    if not is_feed:
+        raise ValueError("Response is not an RSS or Atom feed")
+
+
+def _fetch_one(feed_config, cache_entry):
+    """
+    Fetch and parse a single RSS feed (runs in a worker thread)
+    Streams the response body straight into the parser and sends
+    If-None-Match / If-Modified-Since from the cached validators
+    Returns (feed_name, feed dict with status/etag/modified/entries) or (feed_name, exception) on failure
+    """
+    import requests
+    
+    feed_name = feed_config["name"]
+    feed_url = feed_config["url"]
+    
+    headers = dict(FEED_REQUEST_HEADERS)
+    if cache_entry.get("etag"):
+        headers["If-None-Match"] = cache_entry["etag"]
+    if cache_entry.get("modified"):
+        headers["If-Modified-Since"] = cache_entry["modified"]
+    
+    try:
+        with requests.get(feed_url, stream=True, timeout=30, headers=headers) as response:
+            if response.status_code == 304:
+                return feed_name, {"status": 304}
+            
+            response.raise_for_status()
+            
+            # Let urllib3 undo gzip/deflate/br so the parser consumes the decoded stream
+            response.raw.decode_content = True
+            entries = list(parse_feed_stream(response.raw))
+            
+            return feed_name, {
+                "status": response.status_code,
+                "etag": response.headers.get("ETag"),
+                "modified": response.headers.get("Last-Modified"),
+                "entries": entries
+            }
+    except Exception as e:
+        return feed_name, e
+
+
 def fetch_rss_feeds():
     """
-    Parse all RSS feeds and return entries with feed information
-    Returns list of dicts with: feed_name, title, link, published_parsed
+    Parse all RSS feeds concurrently and return entries with feed information
+    Feeds answering 304 Not Modified reuse the entries cached from the previous run
+    Returns list of Article objects
     """
     all_articles = []
     
     print("Loading configuration...")
     print(f"Checking {len(config.RSS_FEEDS)} RSS feeds...\n")
     
-    for feed_config in config.RSS_FEEDS:
-        feed_name = feed_config["name"]
+    feed_cache = load_feed_cache()
+    cache_entries = [feed_cache.get(feed_config["url"], {}) for feed_config in config.RSS_FEEDS]
+    
+    # Feed downloads are network-bound, so fetch them in parallel threads
+    max_workers = max(1, min(config.MAX_FEED_WORKERS, len(config.RSS_FEEDS)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_fetch_one, config.RSS_FEEDS, cache_entries))
+    
+    # Report results serially (in config order) to keep logs readable
+    for feed_config, (feed_name, feed) in zip(config.RSS_FEEDS, results):
         feed_url = feed_config["url"]
         
         print(f"Checking feed: {feed_name}...")
         
-        try:
-            feed = feedparser.parse(feed_url)
-            
-            if feed.bozo and feed.bozo_exception:
-                print(f"  Warning: Feed parsing issue - {feed.bozo_exception}\n")
-                continue
-            
-            for entry in feed.entries:
-                # Extract article information
-                article = {
-                    "feed_name": feed_name,
-                    "title": entry.get("title", "No title"),
-                    "link": entry.get("link", ""),
-                    "published_parsed": entry.get("published_parsed"),
-                    "published": entry.get("published", ""),
-                    "description": entry.get("description", "")
-                }
-                
-                if article["published_parsed"]:
-                    all_articles.append(article)
-            
-            print(f"  Found {len(feed.entries)} articles\n")
-            
-        except Exception as e:
-            print(f"  Error fetching feed: {e}\n")
+        if isinstance(feed, Exception):
+            print(f"  Error fetching feed: {feed}\n")
+            continue
+        
+        # Unchanged since last run: no body was sent, reuse the previous entries
+        if feed.get("status") == 304:
+            cached_entries = feed_cache.get(feed_url, {}).get("entries", [])
+            all_articles.extend(Article(feed_name=feed_name, **entry) for entry in cached_entries)
+            print(f"  Not modified, reusing {len(cached_entries)} cached articles\n")
             continue
+        
+        # Entries without a usable date cannot be filtered by recency
+        dated_entries = [entry for entry in feed["entries"] if entry["published_ts"] is not None]
+        
+        all_articles.extend(Article(feed_name=feed_name, **entry) for entry in dated_entries)
+        feed_cache[feed_url] = {
+            "etag": feed["etag"],
+            "modified": feed["modified"],
+            "entries": dated_entries
+        }
+        
+        print(f"  Found {len(feed['entries'])} articles\n")
+    
+    try:
+        save_feed_cache(feed_cache)
+    except OSError as e:
+        print(f"  Warning: Could not save feed cache - {e}\n")
     
     return all_articles
 
 
+def load_seen_filter():
+    """
+    Load the Bloom filter of already-processed article links from storage
+    Creates an empty filter on first run
+    """
+    from pybloom_live import BloomFilter
+    
+    bloom_file = Path("storage") / "seen.bloom"
+    
+    if bloom_file.exists():
+        try:
+            with open(bloom_file, "rb") as f:
+                return BloomFilter.fromfile(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read seen-articles filter - {e}\n")
+    
+    return BloomFilter(
+        capacity=config.SEEN_FILTER_CAPACITY,
+        error_rate=config.SEEN_FILTER_ERROR_RATE
+    )
+
+
+def save_seen_filter(seen):
+    """
+    Persist the Bloom filter of already-processed article links to storage
+    """
+    storage_dir = Path("storage")
+    storage_dir.mkdir(exist_ok=True)
+    
+    bloom_file = storage_dir / "seen.bloom"
+    tmp_file = bloom_file.with_suffix(".bloom.tmp")
+    
+    with open(tmp_file, "wb") as f:
+        seen.tofile(f)
+    os.replace(tmp_file, bloom_file)
+
+
+def drop_seen_articles(articles, seen):
+    """
+    Remove articles whose link was already processed in a previous run
+    Returns list of articles not yet seen
+    """
+    new_articles = [article for article in articles if article.link not in seen]
+    
+    skipped = len(articles) - len(new_articles)
+    if skipped:
+        print(f"Skipped {skipped} articles already processed in previous runs\n")
+    
+    return new_articles
+
+
+def drop_near_duplicates(articles):
+    """
+    Remove articles whose title + description simhash is within SIMHASH_MAX_DISTANCE
+    bits of an earlier article in the list (the same story published by several feeds)
+    Returns (list of articles with the first occurrence kept,
+             dict mapping each kept article's link to the copies suppressed in its favour)
+    """
+    from simhash import Simhash, SimhashIndex
+    
+    index = SimhashIndex([], k=config.SIMHASH_MAX_DISTANCE)
+    unique_articles = []
+    duplicates = {}
+    
+    for i, article in enumerate(articles):
+        fingerprint = Simhash(f"{article.title} {article.description}")
+        
+        near_dups = index.get_near_dups(fingerprint)
+        if near_dups:
+            kept = unique_articles[min(int(j) for j in near_dups)]
+            duplicates.setdefault(kept.link, []).append(article)
+            continue
+        
+        index.add(str(len(unique_articles)), fingerprint)
+        unique_articles.append(article)
+    
+    return unique_articles, duplicates
+
+
 def filter_recent_articles(articles):
     """
     Filter articles from last 24 hours, sort by date (newest first), limit to MAX_ARTICLES
-    Returns filtered and sorted list
+    The cutoff comparison and sort run vectorized over all publish timestamps at once
+    Returns (filtered and sorted list, near-duplicate copies keyed by kept article link)
     """
+    import numpy as np
+    
     if not articles:
-        return []
+        return [], {}
     
     # Calculate cutoff time (24 hours ago)
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=config.HOURS_LOOKBACK)
     current_time = datetime.now(timezone.utc)
+    cutoff_time = current_time - timedelta(hours=config.HOURS_LOOKBACK)
     
     print(f"Current time (UTC): {current_time}")
     print(f"Cutoff time (UTC): {cutoff_time} (last {config.HOURS_LOOKBACK} hours)\n")
     
-    recent_articles = []
-    skipped_count = 0
+    # Compare plain Unix timestamps instead of building a datetime per article
+    current_ts = int(current_time.timestamp())
+    cutoff_ts = int(cutoff_time.timestamp())
     
-    for article in articles:
-        if not article["published_parsed"]:
-            skipped_count += 1
-            continue
-        
-        # Convert published_parsed (time.struct_time) to datetime
-        try:
-            # published_parsed is a time.struct_time, convert to datetime
-            pub_time = datetime(*article["published_parsed"][:6], tzinfo=timezone.utc)
-            article["published_datetime"] = pub_time
-            article["published_datetime_str"] = pub_time.isoformat()
-            
-            # Check if article is within the last 24 hours
-            if pub_time >= cutoff_time:
-                recent_articles.append(article)
-            else:
-                skipped_count += 1
-                # Debug: show a few skipped articles
-                if skipped_count <= 3:
-                    hours_ago = (current_time - pub_time).total_seconds() / 3600
-                    print(f"  Skipped (too old): '{article['title'][:50]}...' - {hours_ago:.1f} hours ago")
-        except (ValueError, TypeError) as e:
-            # Skip articles with invalid dates
-            skipped_count += 1
-            continue
+    # Every article carries a valid published_ts (undated entries are dropped while fetching)
+    stamps = np.fromiter((article.published_ts for article in articles), dtype="int64", count=len(articles))
+    mask = stamps >= cutoff_ts
     
-    # Sort by publication date (newest first)
-    recent_articles.sort(key=lambda x: x["published_datetime"], reverse=True)
+    old_indices = np.flatnonzero(~mask)
+    skipped_count = len(old_indices)
     
-    # Limit to MAX_ARTICLES
-    limited_articles = recent_articles[:config.MAX_ARTICLES]
+    # Debug: show a few skipped articles
+    for i in old_indices[:3]:
+        hours_ago = (current_ts - stamps[i]) / 3600
+        print(f"  Skipped (too old): '{articles[i].title[:50]}...' - {hours_ago:.1f} hours ago")
     
-    print(f"\nFound {len(recent_articles)} articles in the last {config.HOURS_LOOKBACK} hours")
-    print(f"Skipped {skipped_count} articles (too old or invalid date)")
+    # Sort by publication date (newest first)
+    recent_indices = np.flatnonzero(mask)
+    order = recent_indices[np.argsort(-stamps[recent_indices], kind="stable")]
+    recent_articles = [articles[i] for i in order]
+    
+    # Drop cross-feed copies of the same story, then limit to MAX_ARTICLES
+    unique_articles, duplicates = drop_near_duplicates(recent_articles)
+    limited_articles = unique_articles[:config.MAX_ARTICLES]
+    
+    # Only the survivors need datetime objects
+    for article in limited_articles:
+        article.published_datetime = datetime.fromtimestamp(article.published_ts, timezone.utc)
+    
+    print(f"\nFound {len(recent_indices)} articles in the last {config.HOURS_LOOKBACK} hours")
+    print(f"Skipped {skipped_count} articles (too old)")
+    if len(unique_articles) < len(recent_articles):
+        print(f"Skipped {len(recent_articles) - len(unique_articles)} near-duplicate articles")
     print(f"Processing top {len(limited_articles)} articles (budget limit: {config.MAX_ARTICLES})\n")
     
-    return limited_articles
+    return limited_articles, duplicates
 
 
-def summarize_with_perplexity(api_key, title, url):
+def _summary_cache_key(url):
+    """
+    Cache key for one article's summary
     """
-    Send article title + URL to Perplexity API (sonar model), return summary
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def summarize_batch(api_key, items):
     """
+    Summarize all articles and produce the final overview, reusing summaries cached
+    from previous runs (e.g. a rerun after a crash) so only new articles are sent
+    items is a list of (title, url) pairs
+    Returns (list of summaries aligned with items, overview text)
+    """
+    from diskcache import Cache
+    
+    keys = [_summary_cache_key(url) for _, url in items]
+    # The overview covers the same set of articles whatever order they arrive in
+    overview_key = "overview:" + hashlib.sha256("\n".join(sorted(keys)).encode("utf-8")).hexdigest()
+    expire = config.SUMMARY_CACHE_DAYS * 86400
+    
+    with Cache(str(Path("storage") / "summary_cache")) as cache:
+        summaries = [cache.get(key) for key in keys]
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        overview = cache.get(overview_key)
+        
+        if not missing and overview is not None:
+            print("Using cached summaries from a previous run\n")
+            return summaries, overview
+        
+        if missing:
+            known_summaries = [summary for summary in summaries if summary is not None]
+            if known_summaries:
+                print(f"Reusing {len(known_summaries)} cached summaries, requesting {len(missing)}\n")
+            
+            new_summaries, overview = _request_batch_summaries(
+                api_key,
+                [items[i] for i in missing],
+                known_summaries
+            )
+            for i, summary in zip(missing, new_summaries):
+                summaries[i] = summary
+                cache.set(keys[i], summary, expire=expire)
+        else:
+            # Every summary is cached but this exact set has no overview yet
+            print("Using cached summaries, requesting overview only\n")
+            overview = _request_overview(api_key, summaries)
+        
+        cache.set(overview_key, overview, expire=expire)
+    
+    return summaries, overview
+
+
+def _request_batch_summaries(api_key, items, known_summaries=()):
+    """
+    Summarize all articles and produce the final overview in a single Perplexity request
+    items is a list of (title, url) pairs; known_summaries (already summarized articles
+    of the same run) are only fed into the overview
+    Returns (list of summaries aligned with items, overview text)
+    """
+    import requests
+    
     endpoint = "https://api.perplexity.ai/chat/completions"
     
     headers = {
@@ -147,7 +588,42 @@ def summarize_with_perplexity(api_key, title, url):
         "Content-Type": "application/json"
     }
     
-    prompt = f"Summarize the key updates in this article in 2 sentences. Title: {title}, URL: {url}"
+    numbered_articles = "\n".join(
+        [f"{i}. Title: {title}, URL: {url}" for i, (title, url) in enumerate(items, 1)]
+    )
+    
+    prompt = f"""Summarize the key updates of each of these {len(items)} articles in 2 sentences each, in the same order:
+
+{numbered_articles}
+"""
+    
+    if known_summaries:
+        combined_summaries = "\n\n".join([f"• {summary}" for summary in known_summaries])
+        prompt += f"""
+These articles were already summarized, include them in the overview as well:
+
+{combined_summaries}
+"""
+    
+    prompt += """
+Also create a concise bullet-point overview summarizing the key AI and tech news across all articles.
+Format the overview as clean bullet points without titles or links. Focus on the main developments and trends."""
+    
+    schema = {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"summary": {"type": "string"}},
+                    "required": ["summary"]
+                }
+            },
+            "overview": {"type": "string"}
+        },
+        "required": ["items", "overview"]
+    }
     
     payload = {
         "model": "sonar",
@@ -157,54 +633,39 @@ def summarize_with_perplexity(api_key, title, url):
                 "content": prompt
             }
         ],
-        "max_tokens": 250
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"schema": schema}
+        },
+        "max_tokens": 250 * len(items) + 300
     }
     
     try:
-        response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+        response = get_session().post(endpoint, json=payload, headers=headers, timeout=60)
         response.raise_for_status()
         
         result = response.json()
-        summary = result["choices"][0]["message"]["content"].strip()
-        
-        return summary
+        content = json.loads(result["choices"][0]["message"]["content"])
+        summaries = [item["summary"].strip() for item in content["items"]]
+        overview = content["overview"].strip()
     
     except requests.exceptions.RequestException as e:
         raise Exception(f"Perplexity API error: {e}")
-
-
-def send_to_telegram(telegram_token, chat_id, feed_name, title, summary, url):
-    """
-    Format and send message to Telegram
-    """
-    endpoint = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise Exception(f"Perplexity API error: invalid batch response - {e}")
     
-    message = f"""Source: {feed_name}
-
-Headline: {title}
-
-Summary: {summary}
-
-Link: {url}"""
+    if len(summaries) != len(items):
+        raise Exception(f"Perplexity API error: expected {len(items)} summaries, got {len(summaries)}")
     
-    payload = {
-        "chat_id": chat_id,
-        "text": message,
-        "parse_mode": "HTML"
-    }
-    
-    try:
-        response = requests.post(endpoint, json=payload, timeout=30)
-        response.raise_for_status()
-        return True
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Telegram API error: {e}")
+    return summaries, overview
 
 
-def generate_final_summary(api_key, summaries):
+def _request_overview(api_key, summaries):
     """
-    Generate a final overview summary from all article summaries using Perplexity
+    Generate the final bullet-point overview from existing article summaries using Perplexity
     """
+    import requests
+    
     endpoint = "https://api.perplexity.ai/chat/completions"
     
     headers = {
@@ -215,7 +676,7 @@ def generate_final_summary(api_key, summaries):
     # Combine all summaries into one text
     combined_summaries = "\n\n".join([f"• {summary}" for summary in summaries])
     
-    prompt = f"""Create a concise bullet-point overview summarizing the key AI and tech news from these summaries. 
+    prompt = f"""Create a concise bullet-point overview summarizing the key AI and tech news from these summaries.
 Format as clean bullet points without titles or links. Focus on the main developments and trends:
 
 {combined_summaries}
@@ -234,7 +695,7 @@ Provide a brief, unified overview in bullet points."""
     }
     
     try:
-        response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+        response = get_session().post(endpoint, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
         
         result = response.json()
@@ -246,96 +707,198 @@ Provide a brief, unified overview in bullet points."""
         raise Exception(f"Perplexity API error: {e}")
 
 
+def format_article(article):
+    """
+    Format a single summarized article as a Telegram message block
+    """
+    return ARTICLE_TEMPLATE.format_map({
+        "feed_name": html.escape(article.feed_name, quote=False),
+        "title": html.escape(article.title, quote=False),
+        "summary": html.escape(article.summary, quote=False),
+        "url": html.escape(article.link, quote=False)
+    })
+
+
+def _split_message(text):
+    """
+    Split text into parts no longer than TELEGRAM_MESSAGE_LIMIT, preferring line
+    and word boundaries so HTML entities are never cut in half
+    Returns list of message parts
+    """
+    parts = []
+    
+    # Only break at a boundary in the second half, so parts stay reasonably full
+    min_cut = TELEGRAM_MESSAGE_LIMIT // 2
+    
+    while len(text) > TELEGRAM_MESSAGE_LIMIT:
+        cut = text.rfind("\n", min_cut, TELEGRAM_MESSAGE_LIMIT)
+        if cut == -1:
+            cut = text.rfind(" ", min_cut, TELEGRAM_MESSAGE_LIMIT)
+        if cut == -1:
+            # No whitespace at all: hard cut, backing off an unterminated entity
+            cut = TELEGRAM_MESSAGE_LIMIT
+            entity_start = text.rfind("&", cut - 10, cut)
+            if entity_start > 0 and ";" not in text[entity_start:cut]:
+                cut = entity_start
+        
+        parts.append(text[:cut].rstrip())
+        text = text[cut:].lstrip()
+    
+    if text:
+        parts.append(text)
+    
+    return parts
+
+
+def group_articles_for_telegram(articles):
+    """
+    Pack formatted articles into as few Telegram messages as fit under the length limit
+    An article that alone exceeds the limit is split over several messages
+    Returns list of (articles in the group, list of message texts)
+    """
+    groups = []
+    group_articles = []
+    group_text = ""
+    
+    for article in articles:
+        block = format_article(article)
+        candidate = f"{group_text}{TELEGRAM_ARTICLE_SEPARATOR}{block}" if group_articles else block
+        
+        # Start a new message once the next article would overflow the current one
+        if group_articles and len(candidate) > TELEGRAM_MESSAGE_LIMIT:
+            groups.append((group_articles, _split_message(group_text)))
+            group_articles = [article]
+            group_text = block
+        else:
+            group_articles.append(article)
+            group_text = candidate
+    
+    if group_articles:
+        groups.append((group_articles, _split_message(group_text)))
+    
+    return groups
+
+
+def send_to_telegram(telegram_token, chat_id, message):
+    """
+    Send a message to Telegram
+    Article messages are sent silently so only the final overview notifies the chat
+    """
+    import requests
+    
+    endpoint = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
+    
+    payload = {
+        "chat_id": chat_id,
+        "text": message,
+        "parse_mode": "HTML",
+        "link_preview_options": {"is_disabled": True},
+        "disable_notification": True
+    }
+    
+    try:
+        response = get_session().post(endpoint, json=payload, timeout=30)
+        response.raise_for_status()
+        return True
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Telegram API error: {e}")
+
+
 def send_final_summary(telegram_token, chat_id, summary_text):
     """
     Send final summary message to Telegram
     """
+    import requests
+    
     endpoint = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
     
-    message = f"""📊 **Daily AI News Overview** ({datetime.now(timezone.utc).strftime('%Y-%m-%d')})
-
-{summary_text}"""
+    message = OVERVIEW_TEMPLATE.format_map({
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        "summary": html.escape(summary_text, quote=False)
+    })
     
     payload = {
         "chat_id": chat_id,
         "text": message,
-        "parse_mode": "Markdown"
+        "parse_mode": "HTML",
+        "link_preview_options": {"is_disabled": True}
     }
     
     try:
-        response = requests.post(endpoint, json=payload, timeout=30)
+        response = get_session().post(endpoint, json=payload, timeout=30)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
         raise Exception(f"Telegram API error: {e}")
 
 
+def _write_archive(filename, payload):
+    """
+    Write payload as zstd-compressed JSON
+    """
+    import orjson
+    import zstandard as zstd
+    
+    # orjson serializes Article dataclasses and their datetime fields natively
+    data = orjson.dumps(
+        payload,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    
+    cctx = zstd.ZstdCompressor(level=3)
+    with open(filename, "wb") as f, cctx.stream_writer(f) as writer:
+        writer.write(data)
+
+
+def load_archive(filename):
+    """
+    Read a zstd-compressed JSON archive written by save_fetched_articles / save_summaries
+    """
+    import orjson
+    import zstandard as zstd
+    
+    dctx = zstd.ZstdDecompressor()
+    with open(filename, "rb") as f, dctx.stream_reader(f) as reader:
+        return orjson.loads(reader.read())
+
+
 def save_fetched_articles(articles):
     """
-    Save all fetched articles to a local JSON file
+    Save all fetched articles to a local compressed JSON file
     """
     storage_dir = Path("storage")
     storage_dir.mkdir(exist_ok=True)
     
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = storage_dir / f"fetched_articles_{timestamp}.json"
+    filename = storage_dir / f"fetched_articles_{timestamp}.json.zst"
     
-    # Prepare articles for JSON serialization
-    serializable_articles = []
-    for article in articles:
-        article_copy = article.copy()
-        # Convert published_parsed to string if it exists
-        if "published_parsed" in article_copy and article_copy["published_parsed"]:
-            try:
-                pub_time = datetime(*article_copy["published_parsed"][:6], tzinfo=timezone.utc)
-                article_copy["published_datetime"] = pub_time.isoformat()
-            except:
-                pass
-            # Remove non-serializable published_parsed
-            article_copy.pop("published_parsed", None)
-        serializable_articles.append(article_copy)
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "total_articles": len(serializable_articles),
-            "articles": serializable_articles
-        }, f, indent=2, ensure_ascii=False)
-    
-    print(f"Saved {len(serializable_articles)} fetched articles to {filename}")
+    _write_archive(filename, {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "total_articles": len(articles),
+        "articles": articles
+    })
+    
+    print(f"Saved {len(articles)} fetched articles to {filename}")
     return filename
 
 
 def save_summaries(processed_articles):
     """
-    Save processed articles with summaries to a local JSON file
+    Save processed articles with summaries to a local compressed JSON file
     """
     storage_dir = Path("storage")
     storage_dir.mkdir(exist_ok=True)
     
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = storage_dir / f"summaries_{timestamp}.json"
-    
-    # Prepare articles for JSON serialization
-    serializable_articles = []
-    for article in processed_articles:
-        article_copy = article.copy()
-        # Convert datetime to string if it exists
-        if "published_datetime" in article_copy:
-            if isinstance(article_copy["published_datetime"], datetime):
-                article_copy["published_datetime"] = article_copy["published_datetime"].isoformat()
-        # Remove non-serializable published_parsed
-        article_copy.pop("published_parsed", None)
-        serializable_articles.append(article_copy)
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "total_summaries": len(serializable_articles),
-            "articles": serializable_articles
-        }, f, indent=2, ensure_ascii=False)
-    
-    print(f"Saved {len(serializable_articles)} summaries to {filename}")
+    filename = storage_dir / f"summaries_{timestamp}.json.zst"
+    
+    _write_archive(filename, {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "total_summaries": len(processed_articles),
+        "articles": processed_articles
+    })
+    
+    print(f"Saved {len(processed_articles)} summaries to {filename}")
     return filename
 
 
@@ -356,72 +919,88 @@ def main():
         save_fetched_articles(all_articles)
         print()
         
+        # Drop articles already summarized in earlier runs before applying the budget limit
+        seen = load_seen_filter()
+        new_articles = drop_seen_articles(all_articles, seen)
+        
         # Filter recent articles
-        articles_to_process = filter_recent_articles(all_articles)
+        articles_to_process, duplicates = filter_recent_articles(new_articles)
         
         if not articles_to_process:
             print(f"No articles found in the last {config.HOURS_LOOKBACK} hours.")
             print("Note: All fetched articles have been saved to storage/ directory.")
             return
         
-        # Process each article
+        # Summarize all articles (plus the final overview) in one Perplexity request
+        print(f"Summarizing {len(articles_to_process)} articles in one request...\n")
+        try:
+            summaries, final_summary = summarize_batch(
+                perplexity_key,
+                [(article.title, article.link) for article in articles_to_process]
+            )
+        except Exception as e:
+            summaries = [e] * len(articles_to_process)
+            final_summary = None
+        
+        # Attach summaries to articles
         successful_count = 0
         processed_articles = []
-        successful_summaries = []  # Collect summaries for final overview
+        summarized_articles = []
         
-        for i, article in enumerate(articles_to_process, 1):
-            print(f"[{i}/{len(articles_to_process)}] Processing article: {article['title']}")
-            print("Summarizing...")
+        for i, (article, summary) in enumerate(zip(articles_to_process, summaries), 1):
+            print(f"[{i}/{len(articles_to_process)}] Processing article: {article.title}")
             
+            article.processed_at = datetime.now(timezone.utc).isoformat()
+            processed_articles.append(article)
+            
+            if isinstance(summary, Exception):
+                print(f"Error processing '{article.title}': {summary}\n")
+                # Still save the article even if processing failed
+                article.error = str(summary)
+                continue
+            
+            article.summary = summary
+            summarized_articles.append(article)
+        
+        # Send summaries to Telegram, packing as many articles per message as fit
+        for group, messages in group_articles_for_telegram(summarized_articles):
             try:
-                # Get summary from Perplexity
-                summary = summarize_with_perplexity(
-                    perplexity_key,
-                    article["title"],
-                    article["link"]
-                )
-                
-                # Add summary to article data
-                article["summary"] = summary
-                article["processed_at"] = datetime.now(timezone.utc).isoformat()
-                processed_articles.append(article)
-                
-                # Send to Telegram
-                send_to_telegram(
-                    telegram_token,
-                    telegram_chat_id,
-                    article["feed_name"],
-                    article["title"],
-                    summary,
-                    article["link"]
-                )
-                
-                print(f"Sent: {article['title']}\n")
-                successful_count += 1
-                successful_summaries.append(summary)  # Collect for final summary
-                
+                for message in messages:
+                    send_to_telegram(telegram_token, telegram_chat_id, message)
             except Exception as e:
-                print(f"Error processing '{article['title']}': {e}\n")
-                # Still save the article even if processing failed
-                article["error"] = str(e)
-                article["processed_at"] = datetime.now(timezone.utc).isoformat()
-                processed_articles.append(article)
+                print(f"Error sending {len(group)} articles to Telegram: {e}\n")
+                for article in group:
+                    article.error = str(e)
                 continue
+            
+            for article in group:
+                print(f"Sent: {article.title}")
+                successful_count += 1
+                if article.link:
+                    seen.add(article.link)
+                
+                # Other feeds' copies of a sent story must not be sent on the next run
+                for duplicate in duplicates.get(article.link, []):
+                    if duplicate.link:
+                        seen.add(duplicate.link)
+            print()
         
         # Save all processed articles with summaries locally
         if processed_articles:
             save_summaries(processed_articles)
             print()
         
+        # Remember sent articles so the next run does not summarize them again
+        if successful_count > 0:
+            save_seen_filter(seen)
+        
         # Send final overview summary if we have successful summaries
-        if successful_summaries and successful_count > 0:
-            print("Generating final overview summary...")
+        if final_summary and successful_count > 0:
             try:
-                final_summary = generate_final_summary(perplexity_key, successful_summaries)
                 send_final_summary(telegram_token, telegram_chat_id, final_summary)
                 print("Sent final overview summary to Telegram.\n")
             except Exception as e:
-                print(f"Error generating/sending final summary: {e}\n")
+                print(f"Error sending final summary: {e}\n")
         
         print(f"Done. Processed {successful_count} articles successfully.")
         print(f"All data saved to storage/ directory.")
@@ -0,0 +1,113 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+import main
+
+
+FEEDS = [
+    {"name": "Feed A", "url": "https://a.example/rss"},
+    {"name": "Feed B", "url": "https://b.example/rss"},
+    {"name": "Feed C", "url": "https://c.example/rss"}
+]
+
+
+def _feed_body(feed, published):
+    """
+    Build an RSS 2.0 document carrying the same story under a feed-specific link
+    """
+    host = feed["url"].split("/")[2]
+
+    return f"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>{feed["name"]}</title>
+<item>
+<title>OpenAI releases a new reasoning model for developers</title>
+<link>https://{host}/story</link>
+<description>The model is available in the API today and outperforms earlier releases on coding benchmarks.</description>
+<pubDate>{published}</pubDate>
+</item>
+</channel></rss>""".encode("utf-8")
+
+
+class FakeFeedResponse:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+        self.headers = {"ETag": '"v1"'}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeApiResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self):
+        self.perplexity_calls = 0
+        self.telegram_messages = []
+
+    def post(self, url, **kwargs):
+        payload = kwargs["json"]
+
+        if "perplexity" in url:
+            self.perplexity_calls += 1
+            prompt = payload["messages"][0]["content"]
+            count = prompt.count("Title: ")
+            content = {
+                "items": [{"summary": f"Summary {i}"} for i in range(count)],
+                "overview": "- Overview"
+            }
+            return FakeApiResponse({"choices": [{"message": {"content": json.dumps(content)}}]})
+
+        self.telegram_messages.append(payload["text"])
+        return FakeApiResponse({"ok": True})
+
+
+def test_near_duplicates_are_not_sent_on_the_next_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "key")
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+    monkeypatch.setattr(main.config, "RSS_FEEDS", FEEDS)
+
+    published = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1))
+    bodies = {feed["url"]: _feed_body(feed, published) for feed in FEEDS}
+
+    def fake_get(url, headers=None, **kwargs):
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeFeedResponse(304)
+        return FakeFeedResponse(200, bodies[url])
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    session = FakeSession()
+    monkeypatch.setattr(main, "_SESSION", session)
+
+    # First run sends the story once (plus the overview) and suppresses the other feeds' copies
+    main.main()
+    assert session.perplexity_calls == 1
+    assert len(session.telegram_messages) == 2
+    assert "https://a.example/story" in session.telegram_messages[0]
+
+    # Second run gets 304s for every feed and must not send the suppressed copies
+    main.main()
+    assert session.perplexity_calls == 1
+    assert len(session.telegram_messages) == 2